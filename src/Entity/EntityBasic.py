@@ -14,6 +14,9 @@ class EntityBasic:
     Entity name: max 64 characters, all ASCII characters allowed.
     Short code: always 4 characters, if less than 4, then padded with space characters to the right. Only latin
     characters without diacritics, digits, and space characters allowed. Can't be 4 spaces.
+
+    Change listeners (functions taking no arguments) can be registered with add_change_listener. They are called
+    whenever a detail shown in the turn order display (name, short code, initiative, conditions) is changed.
     """
     def __init__(self, entity_name: str, short_code: str, initiative: int):
         # argument validation
@@ -41,12 +44,29 @@ class EntityBasic:
         self.__code = code_to_use
         self.__initiative = initiative
         self.__conds = conditions_dict
+        self.__change_listeners = []
+
+    def add_change_listener(self, listener):
+        """Registers a function, taking no arguments, to be called whenever a displayed detail is changed."""
+        if listener not in self.__change_listeners:
+            self.__change_listeners.append(listener)
+
+    def remove_change_listener(self, listener):
+        """Unregisters a change listener. If the listener was not registered, nothing happens."""
+        if listener in self.__change_listeners:
+            self.__change_listeners.remove(listener)
+
+    def notify_change(self):
+        """Calls every registered change listener."""
+        for listener in self.__change_listeners:
+            listener()
 
     def set_entity_name(self, new_name: str):
         if len(new_name) > MAX_NAME_LEN:
             raise AssertionError("Tried to change entity's name, but its name had more than " + str(MAX_NAME_LEN) +
                                  " characters. Entity name: " + self.__name)
         self.__name = new_name
+        self.notify_change()
 
     def set_short_code(self, new_code: str):
         if len(new_code) > SCODE_LEN:
@@ -57,15 +77,18 @@ class EntityBasic:
         else:
             code_to_use = new_code
         self.__code = code_to_use
+        self.notify_change()
 
     def set_initiative(self, new_init: int):
         self.__initiative = new_init
+        self.notify_change()
 
     def set_condition(self, condition_name: str, set_on: bool):
         if condition_name not in list(self.__conds.keys()):
             raise AssertionError("Tried to set the condition " + condition_name + " for entity " + self.__name +
                                  ", but that condition does not exist in its condition dictionary.")
         self.__conds[condition_name] = set_on
+        self.notify_change()
 
     def get_name(self) -> str:
         return self.__name
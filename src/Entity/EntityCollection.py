@@ -20,10 +20,37 @@ class EntityCollection:
 
     Note: There is nothing to stop the same entity being added multiple times, or two entities with the same parameters
     being added.
+
+    The turn order display views (names/codes, initiatives, and HP/condition summaries) are cached as tuples. The cache
+    is cleared when an entity is added, imported, or moved, or when an entity in the collection reports a change to one
+    of its displayed details. Hits and misses are counted so the hit rate can be monitored.
     """
 
     def __init__(self):
         self.__entities = []
+        self.__view_cache = {}
+        self.__view_cache_hits = 0
+        self.__view_cache_misses = 0
+
+    def invalidate_views(self):
+        """Clears the cached turn order display views. They are rebuilt on their next read."""
+        self.__view_cache = {}
+
+    def __watch_entity(self, entity: Union[EntityBasic, EntityEnemy, EntityCharges, EntityLegendary]):
+        entity.add_change_listener(self.invalidate_views)
+        self.invalidate_views()
+
+    def __get_view(self, view_name: str, row_builder):
+        """
+        Returns the cached view view_name. If it is not cached, builds it as a tuple with one row_builder(entity) row
+        per entity, in turn order.
+        """
+        if view_name in self.__view_cache:
+            self.__view_cache_hits += 1
+        else:
+            self.__view_cache_misses += 1
+            self.__view_cache[view_name] = tuple(row_builder(i) for i in self.__entities)
+        return self.__view_cache[view_name]
 
     def add_entity(self, entity: Union[EntityBasic, EntityEnemy, EntityCharges, EntityLegendary]):
         if len(self.__entities) < 1:
@@ -45,28 +72,80 @@ class EntityCollection:
                 i += 1
             first_less_equal = max(0, first_less_equal)
             self.__entities.insert(first_less_equal, entity)
+        self.__watch_entity(entity)
+
+    def move_entity(self, turn_num: int, new_turn_num: int):
+        """
+        Moves the entity at zero-indexed turn_num so that it is at new_turn_num in the turn order, without changing its
+        initiative. If either turn number is outside range of entity list, raises error.
+        """
+        num_ents = len(self.__entities)
+        if not (0 <= turn_num < num_ents) or not (0 <= new_turn_num < num_ents):
+            raise IndexError("Tried to move entity " + str(turn_num) + " to " + str(new_turn_num) + " in " +
+                             "EntityCollection, but there are only " + str(num_ents) + " entities.")
+        self.__entities.insert(new_turn_num, self.__entities.pop(turn_num))
+        self.invalidate_views()
+
+    def get_names_codes_view(self) -> tuple[tuple[str, str], ...]:
+        """
+        Returns a cached tuple of tuples. Each tuple is (entity name, entity short code) for an entity. In turn order.
+        If no entities, returns empty tuple.
+        """
+        return self.__get_view(
+            "NamesCodes",
+            lambda ent: (ent.get_name(), ent.get_short_code())
+        )
+
+    def get_initiatives_view(self) -> tuple[tuple[str, str, int], ...]:
+        """
+        Returns a cached tuple of tuples. Each tuple is (entity name, entity short code, entity initiative) for an
+        entity. In turn order. If no entities, returns empty tuple.
+        """
+        return self.__get_view(
+            "Initiatives",
+            lambda ent: (ent.get_name(), ent.get_short_code(), ent.get_initiative())
+        )
+
+    def get_summary_view(self) -> tuple[tuple, ...]:
+        """
+        Returns a cached tuple of tuples. Each tuple is (entity name, entity short code, current HP, max HP, temp HP,
+        active conditions) for an entity. In turn order. The HP values are None for entities that do not track HP.
+        Active conditions is a tuple of the names of the conditions that are set on. If no entities, returns empty
+        tuple.
+        """
+        def build_row(ent):
+            if isinstance(ent, EntityEnemy):
+                hp_details = (ent.get_current_hp(), ent.get_max_hp(), ent.get_temp_hp())
+            else:
+                hp_details = (None, None, None)
+            active_conds = tuple(key for key, val in ent.get_condition_dict().items() if val)
+            return (ent.get_name(), ent.get_short_code()) + hp_details + (active_conds,)
+
+        return self.__get_view("Summary", build_row)
+
+    def get_view_cache_hit_rate(self) -> float:
+        """
+        Returns the fraction of display view reads that were served from the cache. If no views have been read yet,
+        returns 0.0.
+        """
+        total_reads = self.__view_cache_hits + self.__view_cache_misses
+        if total_reads < 1:
+            return 0.0
+        return self.__view_cache_hits / total_reads
 
     def get_entity_names_codes(self):
         """
         Returns a list of tuples. Each tuple is (entity name, entity short code) for an entity. In turn order.
         If no entities, returns empty list.
         """
-        return_arr = []
-        if len(self.__entities) > 0:
-            for i in self.__entities:
-                return_arr.append((i.get_name(), i.get_short_code()))
-        return return_arr
+        return list(self.get_names_codes_view())
 
     def get_entity_initiatives(self):
         """
         Returns a list of tuples. Each tuple is (entity name, entity short code, entity initiative) for an entity.
         In turn order. If no entities, returns empty list.
         """
-        return_arr = []
-        if len(self.__entities) > 0:
-            for i in self.__entities:
-                return_arr.append((i.get_name(), i.get_short_code(), i.get_initiative()))
-        return return_arr
+        return list(self.get_initiatives_view())
 
     def get_single_entity(self, turn_num: int):
         """
@@ -201,6 +280,7 @@ class EntityCollection:
                     case _:
                         raise KeyError()
                 self.__entities.append(new_obj)
+                self.__watch_entity(new_obj)
         except KeyError:
             raise AssertionError(errdesc)
         except TypeError:
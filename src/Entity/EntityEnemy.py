@@ -30,6 +30,8 @@ class EntityEnemy(EntityBasic):
 
     Calling the "damage" method when the entity does not meet the requirements to take damage has no effect.
     Calling the "heal" method when the entity does not meet the requirements to be healed has no effect.
+
+    Any change to maximum, current, or temporary HP calls the registered change listeners.
     """
 
     def __init__(self, entity_name: str, short_code: str, initiative: int, max_hp: int):
@@ -48,18 +50,21 @@ class EntityEnemy(EntityBasic):
         self.__max_hp = 0
         if self.__current_hp > new_max_hp:
             self.__current_hp = new_max_hp
+        self.notify_change()
 
     def set_current_hp(self, new_hp: int):
         if new_hp < 0:
             self.__current_hp = 0
         else:
             self.__current_hp = new_hp
+        self.notify_change()
 
     def set_temp_hp(self, new_temp_hp: int):
         if new_temp_hp < 0:
             self.__temp_hp = 0
         else:
             self.__temp_hp = new_temp_hp
+        self.notify_change()
 
     def get_max_hp(self) -> int:
         return self.__max_hp
@@ -75,6 +80,7 @@ class EntityEnemy(EntityBasic):
             self.__max_hp,
             self.__current_hp + heal_amount
         )
+        self.notify_change()
 
     def damage(self, damage_amount: int):
         if self.__temp_hp > 0:
@@ -87,6 +93,7 @@ class EntityEnemy(EntityBasic):
                 self.damage(to_damage_current)
         else:
             self.__current_hp = max(0, self.__current_hp - damage_amount)
+            self.notify_change()
 
     def export_dict(self):
         base_dict = super().export_dict()